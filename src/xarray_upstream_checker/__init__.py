@@ -1,9 +1,32 @@
 """xarray-upstream-checker: Monitor xarray's upstream dependency CI tests for zarr compatibility."""
 
-from .checker import ZarrUpstreamChecker
-from .exceptions import GitHubAPIError
-from .github_api import GitHubAPIClient
+import importlib
+
 from .main import main
 
 __version__ = "0.1.0"
-__all__ = ["GitHubAPIClient", "GitHubAPIError", "ZarrUpstreamChecker", "main"]
+__all__ = [
+    "GitHubAPIClient",
+    "GitHubAPIError",
+    "TestFailures",
+    "UpstreamReport",
+    "ZarrUpstreamChecker",
+    "main",
+]
+
+# Everything but main is imported on first access, so the console script can
+# handle --help and --version without loading rich and the checker
+_LAZY_EXPORTS = {
+    "GitHubAPIClient": ".github_api",
+    "GitHubAPIError": ".exceptions",
+    "TestFailures": ".models",
+    "UpstreamReport": ".models",
+    "ZarrUpstreamChecker": ".checker",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,108 @@
+"""On-disk cache for GitHub API results."""
+
+import contextlib
+import functools
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "xarray-upstream-checker"
+
+# Characters replaced when turning a cache key into a file name
+_UNSAFE_CHARS_RE = re.compile(r"[^\w.-]")
+
+# Returned by DiskCache.get when a key is absent or expired, since None is a
+# legitimate cached value (e.g. "no zarr version in this log")
+MISSING = object()
+
+
+class DiskCache:
+    """Best-effort JSON cache with one file per key.
+
+    Cache failures (unwritable directory, corrupt entries) are never fatal;
+    they behave like a cache miss.
+    """
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = Path(directory) if directory else DEFAULT_CACHE_DIR
+
+    def _path(self, key: tuple) -> Path:
+        name = "-".join(str(part) for part in key)
+        safe_name = _UNSAFE_CHARS_RE.sub("_", name)
+        if safe_name != name:
+            # Keys such as URLs lose characters when sanitized; a digest of
+            # the original keeps them distinct
+            digest = hashlib.sha1(name.encode()).hexdigest()[:12]
+            safe_name = f"{safe_name[:80]}-{digest}"
+        return self.directory / f"{safe_name}.json"
+
+    def get(self, key: tuple, ttl: Optional[float] = None) -> Any:
+        """Return the cached value, or MISSING if absent or older than ``ttl``."""
+        try:
+            with open(self._path(key)) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return MISSING
+
+        if ttl is not None and time.time() - entry.get("created", 0) > ttl:
+            return MISSING
+        return entry.get("value", MISSING)
+
+    def set(self, key: tuple, value: Any) -> None:
+        """Store a JSON-serializable value under ``key``."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent readers never see partial files
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"created": time.time(), "value": value}, f)
+            os.replace(tmp_path, self._path(key))
+        except (OSError, TypeError, ValueError):
+            # Don't leave the partial file behind (e.g. value not serializable)
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+
+
+def cached_if_final(
+    kind: str,
+    is_final: Callable[[Any], bool] = lambda _result: True,
+    ttl: Optional[float] = None,
+):
+    """Cache a method's result in ``self.cache`` keyed by ``(kind, *args)``.
+
+    Results are only stored when ``is_final(result)`` is true, so data that
+    can still change (e.g. jobs of an in-progress run) is always refetched.
+    Exceptions propagate and are never cached. Caching is skipped entirely
+    when ``self.cache`` is None.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args):
+            cache = self.cache
+            if cache is None:
+                return method(self, *args)
+
+            key = (kind, *args)
+            value = cache.get(key, ttl=ttl)
+            if value is not MISSING:
+                return value
+
+            value = method(self, *args)
+            if is_final(value):
+                cache.set(key, value)
+            return value
+
+        return wrapper
+
+    return decorator
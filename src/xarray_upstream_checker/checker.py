@@ -1,22 +1,192 @@
 """Core ZarrUpstreamChecker class for analyzing xarray CI."""
 
 import re
+import threading
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from typing import Optional
 
 from rich.console import Console
 
+from .cache import MISSING
+from .cache import DiskCache
+from .cache import cached_if_final
 from .exceptions import GitHubAPIError
 from .github_api import GitHubAPIClient
+from .models import LogsAnalysis
+from .models import TestFailures
+from .models import UpstreamReport
 
 console = Console()
 
+# Upper bound on threads fetching jobs for candidate runs; kept at or below
+# the API client's request limit so workers don't just queue on it
+MAX_CONCURRENCY = 5
+
+# Part of the on-disk key of log analyses; bump it whenever the patterns or
+# LogsAnalysis change so stale results are not reused
+LOG_ANALYSIS_VERSION = 1
+
+# X.Y.Z plus any pre-release/local suffix, e.g. 3.1.3.dev23+g62d1a6abc
+_VERSION = r"(\d+\.\d+\.\d+[\w.+-]*)"
+
+# All zarr version patterns fused into one alternation, most specific first.
+# Each alternative has exactly one group, so ``match.lastindex`` tells which
+# alternative matched and lower values take priority. ``zarr`` must start a
+# word, lead-ins are lazy and the gap before the version is digit-free and
+# bounded, so a long line with many failed candidates costs linear time.
+_ZARR_VERSION_RE = re.compile(
+    "|".join(
+        (
+            rf"\bzarr:\s+{_VERSION}",  # zarr: 3.1.3.dev23+g62d1a6abc
+            rf"\bzarr\s+{_VERSION}",  # zarr 2.18.3
+            rf"Installing\b.*?\bzarr[_-]?python?\D{{0,200}}{_VERSION}",  # Installing zarr-python-2.18.3
+            rf"(?:Successfully installed|Requirement already satisfied)\b.*?\bzarr[_-]?python?\D{{0,200}}{_VERSION}",  # pip install output
+        )
+    ),
+    re.IGNORECASE,
+)
+
+# Test names containing any of these are attributed to zarr
+_ZARR_RELATED_KEYWORDS = (
+    "zarr",
+    "chunk",
+    "codec",
+    "storage",
+    "blosc",
+    "zlib",
+    "gzip",
+    "compression",
+    "array_api",
+    "buffer",
+)
+_ZARR_KEYWORD_RE = re.compile(
+    "|".join(map(re.escape, _ZARR_RELATED_KEYWORDS)), re.IGNORECASE
+)
+
+# [timestamp] FAILED test_module.py::TestClass::test_method - ValueError: ...
+# Anchored to the line start, allowing the timestamp GitHub prefixes to each
+# log line, so the engine tries one position per line instead of all of them.
+# Group 1 is the test id; group 2 an explicit error type, group 3 a bare assert
+_FAILED_RE = re.compile(
+    r"(?:\S+\s+)?FAILED\s+(\S+::\S+)"
+    r"(?:\s+-\s+(?:(\w+(?:Error|Exception)):|(assert)))?"
+)
+
+# Check-run annotations name the failing test id and any exception types
+_ANNOTATION_TEST_RE = re.compile(r"(\S+\.py::\S+)")
+_ANNOTATION_ERROR_RE = re.compile(r"\b(\w+(?:Error|Exception))\b")
+
+
+def _strip_ansi(text: str) -> str:
+    """Remove ANSI SGR color codes (``ESC [ digits/; m``) from text.
+
+    Most log lines carry no escape codes and are returned unchanged without
+    a copy; otherwise ``str.find`` jumps between escapes instead of running
+    a regex over every character.
+    """
+    start = text.find("\x1b[")
+    if start < 0:
+        return text
+
+    pieces = []
+    pos = 0
+    while start >= 0:
+        end = start + 2
+        while end < len(text) and (text[end].isdigit() or text[end] == ";"):
+            end += 1
+        if end < len(text) and text[end] == "m":
+            pieces.append(text[pos:start])
+            pos = end + 1
+        start = text.find("\x1b[", end)
+    pieces.append(text[pos:])
+    return "".join(pieces)
+
+
+def _analyze_log_lines(lines: Iterable[str]) -> LogsAnalysis:
+    """Extract the zarr version and test failures from log lines in one pass"""
+    analysis = LogsAnalysis()
+    error_types = set()
+    best_rank = None
+    for line in lines:
+        analysis.log_size += len(line)
+        # Every version alternative mentions zarr and every failure line says
+        # FAILED; plain substring tests reject other lines far faster than
+        # any regex, and each pattern only runs on lines that can match it.
+        # The spellings zarr appears in are tested directly, since lowering
+        # every line would copy it
+        is_failure = "FAILED" in line
+        wants_version = best_rank != 1 and (
+            "zarr" in line or "Zarr" in line or "ZARR" in line
+        )
+        if not (is_failure or wants_version):
+            continue
+
+        # Strip ANSI color codes from logs for better parsing
+        clean_line = _strip_ansi(line)
+
+        # Keep the first hit of the highest-priority version alternative
+        if wants_version:
+            for match in _ZARR_VERSION_RE.finditer(clean_line):
+                if best_rank is None or match.lastindex < best_rank:
+                    best_rank = match.lastindex
+                    analysis.zarr_version = match.group(best_rank)
+                    if best_rank == 1:
+                        break
+
+        # One match yields the test id and, if present, its error type
+        match = _FAILED_RE.match(clean_line) if is_failure else None
+        if match:
+            test_name, error_type, bare_assert = match.groups()
+            analysis.failed_tests.append(test_name)
+            if error_type:
+                error_types.add(error_type)
+            elif bare_assert:
+                # Assert failures are treated as AssertionError
+                error_types.add("AssertionError")
+
+    analysis.error_types = sorted(error_types)
+    return analysis
+
+
+def _is_upstream_dev_name(name: str) -> bool:
+    """Whether a lowercased job name is the upstream-dev test job"""
+    return (
+        name.startswith("upstream-dev") and "detect" not in name and "mypy" not in name
+    )
+
+
+def _is_upstream_dev_job(job: dict) -> bool:
+    """Whether a job runs the upstream-dev tests (not trigger detection or mypy)"""
+    return _is_upstream_dev_name(job.get("name", "").lower())
+
+
+def _find_upstream_dev_job(jobs: list[dict]) -> Optional[dict]:
+    """Find the upstream-dev test job (not the trigger-detection or mypy jobs)"""
+    return next((job for job in jobs if _is_upstream_dev_job(job)), None)
+
+
+def _jobs_are_final(jobs: list[dict]) -> bool:
+    """Jobs can be cached forever once every one of them has completed."""
+    return bool(jobs) and all(job.get("status") == "completed" for job in jobs)
+
 
 class ZarrUpstreamChecker:
-    def __init__(self, api_choice: Optional[str] = None):
+    def __init__(self, api_choice: Optional[str] = None, use_cache: bool = True):
         self.xarray_repo = "pydata/xarray"
         self.zarr_repo = "zarr-developers/zarr-python"
         self.workflow_name = "upstream-dev-ci.yaml"
-        self.github_api = GitHubAPIClient(force_api=api_choice)
+        # Finished runs are immutable, so results derived from them are
+        # cached on disk and repeat invocations skip the network
+        self.cache = DiskCache() if use_cache else None
+        self.github_api = GitHubAPIClient(force_api=api_choice, cache=self.cache)
+        # Log analyses by job id, so each log is downloaded at most once
+        self._log_analyses: dict[int, LogsAnalysis] = {}
+        # Jobs by (run id, attempt), so each run's jobs are fetched at most once
+        self._jobs_cache: dict[tuple, list[dict]] = {}
+        self._log_lock = threading.Lock()
 
     def get_latest_workflow_run_with_tests(self) -> dict:
         """Get the most recent workflow run where upstream-dev tests actually executed"""
@@ -41,25 +211,15 @@ class ZarrUpstreamChecker:
                 console.print(
                     f"[green]Found {len(priority_runs)} priority runs (schedule/workflow_dispatch) to check[/green]"
                 )
-                for i, run in enumerate(priority_runs):
+                for i, (run, jobs) in enumerate(
+                    self._iter_runs_with_jobs(priority_runs)
+                ):
                     console.print(
                         f"[dim]Checking {run.get('event', 'unknown')} run {i + 1}/{len(priority_runs)}: {run['databaseId']}[/dim]"
                     )
 
-                    # Get jobs for this run
-                    jobs = self.get_workflow_jobs(run["databaseId"])
-
                     # Find upstream-dev job
-                    upstream_dev_job = next(
-                        (
-                            job
-                            for job in jobs
-                            if job.get("name", "").lower().startswith("upstream-dev")
-                            and "detect" not in job.get("name", "").lower()
-                            and "mypy" not in job.get("name", "").lower()
-                        ),
-                        None,
-                    )
+                    upstream_dev_job = _find_upstream_dev_job(jobs)
 
                     if upstream_dev_job:
                         conclusion = upstream_dev_job.get("conclusion")
@@ -90,22 +250,19 @@ class ZarrUpstreamChecker:
             if not all_runs:
                 raise GitHubAPIError("No workflow runs found on main branch")
 
-            for i, run in enumerate(all_runs):
+            # Skipped or cancelled runs cannot have finished tests, so don't
+            # spend jobs requests on them
+            candidate_runs = [
+                run
+                for run in all_runs
+                if run.get("conclusion") not in ("skipped", "cancelled")
+            ]
+            for i, (run, jobs) in enumerate(self._iter_runs_with_jobs(candidate_runs)):
                 console.print(
-                    f"[dim]Checking run {i + 1}/{len(all_runs)}: {run['databaseId']} ({run.get('event', 'unknown')} event)[/dim]"
+                    f"[dim]Checking run {i + 1}/{len(candidate_runs)}: {run['databaseId']} ({run.get('event', 'unknown')} event)[/dim]"
                 )
 
-                jobs = self.get_workflow_jobs(run["databaseId"])
-                upstream_dev_job = next(
-                    (
-                        job
-                        for job in jobs
-                        if job.get("name", "").lower().startswith("upstream-dev")
-                        and "detect" not in job.get("name", "").lower()
-                        and "mypy" not in job.get("name", "").lower()
-                    ),
-                    None,
-                )
+                upstream_dev_job = _find_upstream_dev_job(jobs)
 
                 if upstream_dev_job and upstream_dev_job.get("conclusion") in [
                     "success",
@@ -125,128 +282,184 @@ class ZarrUpstreamChecker:
         except Exception as e:
             raise GitHubAPIError(f"Failed to get workflow runs: {e}") from e
 
-    def get_workflow_jobs(self, run_id: int) -> list[dict]:
-        """Get jobs for a specific workflow run"""
+    def get_workflow_jobs(
+        self, run_id: int, attempt: Optional[int] = None
+    ) -> list[dict]:
+        """Get jobs for a specific workflow run
+
+        Re-running a run replaces its jobs, so they are only cached on disk
+        per ``attempt`` (the run's ``attempt`` field) when it is known.
+        """
+        key = (run_id, attempt)
+        if key in self._jobs_cache:
+            return self._jobs_cache[key]
+
         try:
-            return self.github_api.get_workflow_jobs(self.xarray_repo, run_id)
+            if attempt is None:
+                jobs = self.github_api.get_workflow_jobs(self.xarray_repo, run_id)
+            else:
+                jobs = self._fetch_workflow_jobs(run_id, attempt)
         except Exception as e:
             console.print(
                 f"[yellow]Warning: Could not get jobs for run {run_id}: {e}[/yellow]"
             )
             return []
 
-    def _find_upstream_dev_job(self, run_id: int) -> Optional[dict]:
-        """Find the upstream-dev job for a given workflow run."""
-        try:
-            jobs = self.github_api.get_workflow_jobs(self.xarray_repo, run_id)
-            return next(
-                (
-                    job
-                    for job in jobs
-                    if job.get("name", "").lower().startswith("upstream-dev")
-                    and "detect" not in job.get("name", "").lower()
-                    and "mypy" not in job.get("name", "").lower()
-                ),
-                None,
-            )
-        except Exception:
-            return None
+        self._jobs_cache[key] = jobs
+        return jobs
+
+    @cached_if_final("jobs", is_final=_jobs_are_final)
+    def _fetch_workflow_jobs(self, run_id: int, attempt: int) -> list[dict]:
+        # GitHub returns the jobs of the latest attempt; ``attempt`` only
+        # keys the cache
+        return self.github_api.get_workflow_jobs(self.xarray_repo, run_id)
+
+    def _iter_runs_with_jobs(self, runs: list[dict]) -> Iterator[tuple[dict, list]]:
+        """Yield ``(run, jobs)`` pairs in order, fetching jobs lazily.
 
-    def get_workflow_logs_summary(self, run_id: int) -> Optional[str]:
-        """Extract zarr version from workflow logs"""
-        version_patterns = [
-            r"zarr:\s+(\d+\.\d+\.\d+(?:[\.\w\d\-\+]+)?)",  # zarr: 3.1.3.dev23+g62d1a6abc
-            r"zarr\s+(\d+\.\d+\.\d+(?:[\.\w\d\-\+]+)?)",  # zarr 2.18.3
-            r"Installing.*zarr[_-]?python?.*?(\d+\.\d+\.\d+(?:[\.\w\d\-\+]+)?)",  # Installing zarr-python-2.18.3
-            r"(?:Successfully installed|Requirement already satisfied).*zarr[_-]?python?[^\d]*(\d+\.\d+\.\d+(?:[\.\w\d\-\+]+)?)",  # pip install output
-        ]
+        The newest run usually has tests, so its jobs are fetched on their
+        own; the remaining runs' jobs are only fetched, all at once, if the
+        caller keeps iterating.
+        """
+        for batch in (runs[:1], runs[1:]):
+            yield from zip(batch, self._get_jobs_for_runs(batch))
 
+    def _get_jobs_for_runs(self, runs: list[dict]) -> list[list[dict]]:
+        """Fetch jobs for several workflow runs concurrently, preserving order"""
+        if not runs:
+            return []
+
+        if self.github_api.supports_graphql and all(
+            run.get("checkSuiteNodeId") for run in runs
+        ):
+            try:
+                self._prefetch_jobs_graphql(runs)
+            except Exception as e:
+                console.print(
+                    f"[dim]GraphQL jobs lookup failed, falling back to REST: {e}[/dim]"
+                )
+
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENCY, len(runs))) as pool:
+            return list(
+                pool.map(
+                    self.get_workflow_jobs,
+                    [run["databaseId"] for run in runs],
+                    [run.get("attempt") for run in runs],
+                )
+            )
+
+    def _prefetch_jobs_graphql(self, runs: list[dict]) -> None:
+        """Load jobs for all runs with a single GraphQL request"""
+        pending = []
+        for run in runs:
+            key = (run["databaseId"], run.get("attempt"))
+            if key in self._jobs_cache:
+                continue
+            use_cache = self.cache and key[1] is not None
+            cached = self.cache.get(("jobs", *key)) if use_cache else MISSING
+            if cached is MISSING:
+                pending.append(run)
+            else:
+                self._jobs_cache[key] = cached
+        if not pending:
+            return
+
+        jobs_by_suite = self.github_api.get_check_suite_jobs(
+            [run["checkSuiteNodeId"] for run in pending]
+        )
+        for run in pending:
+            jobs = jobs_by_suite.get(run["checkSuiteNodeId"])
+            if jobs is None:
+                continue
+            key = (run["databaseId"], run.get("attempt"))
+            self._jobs_cache[key] = jobs
+            if self.cache and key[1] is not None and _jobs_are_final(jobs):
+                self.cache.set(("jobs", *key), jobs)
+
+    def get_workflow_logs_summary(
+        self, run_id: int, jobs: Optional[list[dict]] = None
+    ) -> Optional[str]:
+        """Extract zarr version from workflow logs
+
+        Pass the run's ``jobs`` if they are already known to skip looking them up.
+        """
         try:
-            upstream_job = self._find_upstream_dev_job(run_id)
+            if jobs is None:
+                jobs = self.get_workflow_jobs(run_id)
+            upstream_job = _find_upstream_dev_job(jobs)
             if not upstream_job:
                 return None
 
             job_id = upstream_job.get("databaseId") or upstream_job.get("id")
-            console.print(
-                f"[dim]Getting logs for upstream-dev job {job_id} to find zarr version[/dim]"
-            )
-
-            log_content = self.github_api.get_job_logs(self.xarray_repo, job_id)
-
-            for pattern in version_patterns:
-                matches = re.findall(pattern, log_content, re.IGNORECASE)
-                if matches:
-                    console.print(f"[dim]Found zarr version matches: {matches}[/dim]")
-                    return matches[0]
-
-            return None
+            version = self._analyze_logs(job_id).zarr_version
+            if version:
+                console.print(f"[dim]Found zarr version: {version}[/dim]")
+            return version
 
         except Exception as e:
             console.print(f"[dim]Could not extract zarr version from logs: {e}[/dim]")
             return None
 
-    def get_test_failures(self, run_id: int) -> dict[str, list[str]]:
-        """Extract test failure information from workflow logs"""
-        failure_patterns = [
-            r"FAILED\s+([^:]+::[^-]+)",  # FAILED test_module.py::TestClass::test_method
-        ]
-
-        error_extraction_patterns = [
-            r"FAILED\s+[^-]+ - (\w+(?:Error|Exception)):",  # Explicit error type
-            r"FAILED\s+[^-]+ - (assert)",  # Assert failures (treat as AssertionError)
-        ]
-
-        zarr_related_keywords = [
-            "zarr",
-            "chunk",
-            "codec",
-            "storage",
-            "blosc",
-            "zlib",
-            "gzip",
-            "compression",
-            "array_api",
-            "buffer",
-        ]
+    def _analyze_logs(self, job_id: int) -> LogsAnalysis:
+        """Download and analyze a job log, at most once per job"""
+        with self._log_lock:
+            if job_id not in self._log_analyses:
+                self._log_analyses[job_id] = LogsAnalysis(**self._scan_job_log(job_id))
+            return self._log_analyses[job_id]
+
+    @cached_if_final(f"log_analysis_v{LOG_ANALYSIS_VERSION}")
+    def _scan_job_log(self, job_id: int) -> dict:
+        """Stream a job log through the analyzers (logs only exist for finished jobs)"""
+        console.print(f"[dim]Getting logs for upstream-dev job {job_id}[/dim]")
+
+        # Process the log line by line as it streams in so the full log is
+        # never held in memory
+        analysis = _analyze_log_lines(
+            self.github_api.iter_job_log_lines(self.xarray_repo, job_id)
+        )
+
+        console.print(f"[dim]Analyzed {analysis.log_size} characters of log data[/dim]")
+        return asdict(analysis)
 
+    def get_test_failures(
+        self, run_id: int, jobs: Optional[list[dict]] = None
+    ) -> TestFailures:
+        """Extract test failure information from the job log
+
+        Check-run annotations are only used when the log cannot be fetched;
+        they are capped per step and may not name every failed test.
+
+        Pass the run's ``jobs`` if they are already known to skip looking them up.
+        """
         try:
-            upstream_job = self._find_upstream_dev_job(run_id)
+            if jobs is None:
+                jobs = self.get_workflow_jobs(run_id)
+            upstream_job = _find_upstream_dev_job(jobs)
             if not upstream_job:
                 console.print(
                     f"[yellow]Could not find upstream-dev job in run {run_id}[/yellow]"
                 )
-                return {"zarr_related": [], "other_failures": [], "total_failures": 0}
+                return TestFailures.empty()
 
             job_id = upstream_job.get("databaseId") or upstream_job.get("id")
-            console.print(f"[dim]Getting logs for upstream-dev job {job_id}[/dim]")
 
-            log_content = self.github_api.get_job_logs(self.xarray_repo, job_id)
-
-            console.print(
-                f"[dim]Analyzing {len(log_content)} characters of log data for test failures...[/dim]"
-            )
+            # The log is analyzed for the zarr version anyway, so this reuses
+            # that download
+            try:
+                analysis = self._analyze_logs(job_id)
+            except Exception as e:
+                console.print(
+                    f"[dim]Could not analyze logs for job {job_id}, using annotations: {e}[/dim]"
+                )
+                test_names, error_types = self._get_failures_from_annotations(
+                    upstream_job
+                )
+            else:
+                test_names, error_types = analysis.failed_tests, analysis.error_types
 
-            # Strip ANSI color codes from logs for better parsing
-            clean_logs = re.sub(r"\x1b\[[0-9;]*m|\[[0-9;]*m", "", log_content)
-
-            # Extract test names from FAILED lines
-            test_names = []
-            for pattern in failure_patterns:
-                matches = re.findall(pattern, clean_logs, re.IGNORECASE | re.MULTILINE)
-                if matches:
-                    console.print(f"[dim]Found {len(matches)} test failures[/dim]")
-                test_names.extend(matches)
-
-            # Extract error types
-            error_types = set()
-            for pattern in error_extraction_patterns:
-                matches = re.findall(pattern, clean_logs, re.IGNORECASE | re.MULTILINE)
-                error_types.update(matches)
-
-            # Convert "assert" to "AssertionError" for consistency
-            if "assert" in error_types:
-                error_types.remove("assert")
-                error_types.add("AssertionError")
+            # A test can be reported more than once (e.g. on a rerun or by
+            # several annotations); keep the first occurrence of each
+            test_names = list(dict.fromkeys(test_names))
 
             console.print(
                 f"[dim]Found {len(test_names)} test failures and {len(error_types)} error types[/dim]"
@@ -255,98 +468,127 @@ class ZarrUpstreamChecker:
             # Categorize failures
             zarr_related = []
             other_failures = []
+            # The error types are per job, so every test shares one suffix
+            error_suffix = f" ({', '.join(sorted(error_types))})" if error_types else ""
 
             for test_name in test_names:
                 # Check if it's zarr-related
-                is_zarr_related = any(
-                    keyword in test_name.lower() for keyword in zarr_related_keywords
-                )
+                is_zarr_related = bool(_ZARR_KEYWORD_RE.search(test_name))
 
                 # Clean up test name (remove file path, keep just class::method)
-                clean_test_name = (
-                    test_name.split("::")[-2:] if "::" in test_name else [test_name]
-                )
-                clean_test_name = "::".join(clean_test_name)
+                last = test_name.rfind("::")
+                start = test_name.rfind("::", 0, last) if last > 0 else -1
+                clean_test_name = test_name[start + 2 :] if start >= 0 else test_name
 
-                # Create display format
-                if error_types:
-                    display_name = (
-                        f"{clean_test_name} ({', '.join(sorted(error_types))})"
-                    )
-                else:
-                    display_name = clean_test_name
+                display_name = clean_test_name + error_suffix
 
                 if is_zarr_related:
                     zarr_related.append(display_name)
                 else:
                     other_failures.append(display_name)
 
-            return {
-                "zarr_related": zarr_related,
-                "other_failures": other_failures,
-                "error_types": list(error_types),
-                "total_failures": len(test_names),
-            }
+            return TestFailures(
+                zarr_related=zarr_related,
+                other_failures=other_failures,
+                error_types=list(error_types),
+                total_failures=len(test_names),
+            )
 
         except Exception as e:
             console.print(
                 f"[yellow]Warning: Could not extract test failures: {e}[/yellow]"
             )
 
-        return {"zarr_related": [], "other_failures": [], "total_failures": 0}
+        return TestFailures.empty()
+
+    @cached_if_final("annotations")
+    def _fetch_annotations(self, job_id: int) -> list[dict]:
+        return self.github_api.get_check_run_annotations(self.xarray_repo, job_id)
 
+    def _get_failures_from_annotations(self, job: dict) -> tuple[list[str], list[str]]:
+        """Extract failed test ids and error types from failure-level annotations"""
+        job_id = job.get("databaseId") or job.get("id")
+        try:
+            annotations = self._fetch_annotations(job_id)
+        except Exception as e:
+            console.print(f"[dim]Could not get annotations for job {job_id}: {e}[/dim]")
+            return [], []
+
+        test_names = []
+        error_types = set()
+        for annotation in annotations:
+            # Warnings and notices don't mean a test failed
+            if annotation.get("annotation_level") != "failure":
+                continue
+            text = f"{annotation.get('title') or ''}\n{annotation.get('message') or ''}"
+            if "::" not in text:
+                continue
+            match = _ANNOTATION_TEST_RE.search(text)
+            if match:
+                test_names.append(match.group(1))
+                error_types.update(
+                    match.group(1) for match in _ANNOTATION_ERROR_RE.finditer(text)
+                )
+
+        if test_names:
+            console.print(
+                f"[dim]Found {len(test_names)} test failures in check-run annotations[/dim]"
+            )
+        return test_names, sorted(error_types)
+
+    @cached_if_final("zarr_commit", is_final=lambda commit: commit is not None, ttl=600)
     def get_zarr_latest_commit(self) -> Optional[dict]:
         """Get the latest commit from zarr-python main branch"""
         return self.github_api.get_latest_commit(self.zarr_repo)
 
-    def check_upstream_compatibility(self) -> dict:
+    def check_upstream_compatibility(self) -> UpstreamReport:
         """Main method to check xarray upstream compatibility with zarr"""
         # Get latest workflow run where tests actually executed
         latest_run = self.get_latest_workflow_run_with_tests()
 
         # Get job details
-        jobs = self.get_workflow_jobs(latest_run["databaseId"])
-
-        # Find detect-ci-trigger and upstream-dev jobs
-        detect_trigger_job = next(
-            (
-                job
-                for job in jobs
-                if "detect" in job.get("name", "").lower()
-                and "trigger" in job.get("name", "").lower()
-            ),
-            None,
+        jobs = self.get_workflow_jobs(
+            latest_run["databaseId"], latest_run.get("attempt")
         )
 
-        upstream_dev_job = next(
-            (
-                job
-                for job in jobs
-                if job.get("name", "").lower().startswith("upstream-dev")
-                and "detect" not in job.get("name", "").lower()
-                and "mypy" not in job.get("name", "").lower()
-            ),
-            None,
-        )
+        # Find detect-ci-trigger and upstream-dev jobs in one pass,
+        # lowercasing each name once
+        detect_trigger_job = None
+        upstream_dev_job = None
+        for job in jobs:
+            name = job.get("name", "").lower()
+            if detect_trigger_job is None and "detect" in name and "trigger" in name:
+                detect_trigger_job = job
+            elif upstream_dev_job is None and _is_upstream_dev_name(name):
+                upstream_dev_job = job
+
+        # The remaining lookups are independent network round-trips, so run
+        # them concurrently
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            # Try to get zarr version from logs
+            version_future = pool.submit(
+                self.get_workflow_logs_summary, latest_run["databaseId"], jobs
+            )
 
-        # Try to get zarr version from logs
-        zarr_version_from_logs = self.get_workflow_logs_summary(
-            latest_run["databaseId"]
-        )
+            # Get test failure details if job failed
+            failures_future = None
+            if upstream_dev_job and upstream_dev_job.get("conclusion") == "failure":
+                failures_future = pool.submit(
+                    self.get_test_failures, latest_run["databaseId"], jobs
+                )
+
+            # Get latest zarr commit for freshness check
+            commit_future = pool.submit(self.get_zarr_latest_commit)
 
-        # Get test failure details if job failed
-        test_failures = {}
-        if upstream_dev_job and upstream_dev_job.get("conclusion") == "failure":
-            test_failures = self.get_test_failures(latest_run["databaseId"])
-
-        # Get latest zarr commit for freshness check
-        zarr_commit = self.get_zarr_latest_commit()
-
-        return {
-            "run": latest_run,
-            "detect_trigger_job": detect_trigger_job,
-            "upstream_dev_job": upstream_dev_job,
-            "zarr_version_from_logs": zarr_version_from_logs,
-            "test_failures": test_failures,
-            "zarr_commit": zarr_commit,
-        }
+            zarr_version_from_logs = version_future.result()
+            test_failures = failures_future.result() if failures_future else None
+            zarr_commit = commit_future.result()
+
+        return UpstreamReport(
+            run=latest_run,
+            detect_trigger_job=detect_trigger_job,
+            upstream_dev_job=upstream_dev_job,
+            zarr_version_from_logs=zarr_version_from_logs,
+            test_failures=test_failures,
+            zarr_commit=zarr_commit,
+        )
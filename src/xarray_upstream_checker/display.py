@@ -1,5 +1,7 @@
 """Rich display formatting for xarray upstream checker results."""
 
+import functools
+import sys
 from datetime import datetime
 from typing import Optional
 
@@ -8,15 +10,30 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
+from .models import TestFailures
+
 console = Console()
 
 
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts GitHub's trailing ``Z`` for UTC natively
+    _parse_iso = functools.lru_cache(maxsize=256)(datetime.fromisoformat)
+else:
+
+    @functools.lru_cache(maxsize=256)
+    def _parse_iso(timestamp: str) -> datetime:
+        """Parse a GitHub ISO 8601 timestamp, which may use a trailing ``Z`` for UTC"""
+        if timestamp.endswith("Z"):
+            timestamp = f"{timestamp[:-1]}+00:00"
+        return datetime.fromisoformat(timestamp)
+
+
 def display_results(
     run: dict,
     detect_trigger_job: Optional[dict],
     upstream_dev_job: Optional[dict],
     zarr_version_from_logs: Optional[str],
-    test_failures: dict,
+    test_failures: Optional[TestFailures],
     zarr_commit: Optional[dict],
 ) -> None:
     """Display comprehensive results using Rich formatting"""
@@ -59,20 +76,17 @@ def display_results(
 
     # Job status analysis
     job = upstream_dev_job
+    job_conclusion = job.get("conclusion") if job else None
     job_status_text = ""
 
     if not job:
         job_status_text = "❌ Upstream-dev job not found in this run"
         job_status_color = "red"
-    elif job.get("conclusion") == "skipped" or job.get("status") == "skipped":
+    elif job_conclusion == "skipped" or job.get("status") == "skipped":
         job_status_text = "⏭️ Upstream-dev job was skipped (tests not triggered)"
         job_status_color = "yellow"
-    elif (
-        job.get("conclusion") in ["success", "failure"]
-        or job.get("status") == "completed"
-    ):
+    elif job_conclusion in ["success", "failure"] or job.get("status") == "completed":
         tests_actually_ran = True
-        job_conclusion = job.get("conclusion", job.get("status"))
         if job_conclusion == "success":
             job_status_text = "✅ Upstream-dev job ran successfully"
             job_status_color = "green"
@@ -80,7 +94,8 @@ def display_results(
             job_status_text = "❌ Upstream-dev job failed"
             job_status_color = "red"
         else:
-            job_status_text = f"🔄 Upstream-dev job: {job_conclusion}"
+            job_result = job.get("conclusion", job.get("status"))
+            job_status_text = f"🔄 Upstream-dev job: {job_result}"
             job_status_color = "yellow"
     else:
         job_status_text = f"🔄 Upstream-dev job status: {job.get('status', 'unknown')}"
@@ -97,9 +112,9 @@ def display_results(
         console.print(Panel(version_text, title="📦 Version Info", title_align="left"))
 
     # Test failure details
-    if test_failures and test_failures.get("total_failures", 0) > 0:
+    if test_failures and test_failures.total_failures > 0:
         display_test_failures(test_failures)
-    elif job and job.get("conclusion") == "failure":
+    elif job_conclusion == "failure":
         # Show that there were failures but we couldn't parse them
         no_details_text = Text(
             "⚠️ Tests failed, but could not access logs to determine specific failures.\n"
@@ -114,7 +129,7 @@ def display_results(
     display_freshness_check(run, zarr_commit)
 
     # Summary
-    if tests_actually_ran and job.get("conclusion") == "success":
+    if tests_actually_ran and job_conclusion == "success":
         if zarr_version_from_logs:
             summary = Text(
                 f"✅ All upstream-dev tests passed with zarr {zarr_version_from_logs}",
@@ -125,7 +140,7 @@ def display_results(
                 "✅ All upstream-dev tests passed (zarr version not detected)",
                 style="bold green",
             )
-    elif tests_actually_ran and job.get("conclusion") == "failure":
+    elif tests_actually_ran and job_conclusion == "failure":
         summary = Text("❌ Upstream-dev tests ran but failed", style="bold red")
     elif not tests_actually_ran:
         summary = Text(
@@ -144,10 +159,8 @@ def display_freshness_check(run: dict, zarr_commit: Optional[dict]) -> None:
         return
 
     try:
-        workflow_time = datetime.fromisoformat(run["createdAt"].replace("Z", "+00:00"))
-        zarr_commit_time = datetime.fromisoformat(
-            zarr_commit["date"].replace("Z", "+00:00")
-        )
+        workflow_time = _parse_iso(run["createdAt"])
+        zarr_commit_time = _parse_iso(zarr_commit["date"])
 
         # Check if workflow is testing recent zarr changes
         time_diff = workflow_time - zarr_commit_time
@@ -181,12 +194,12 @@ def display_freshness_check(run: dict, zarr_commit: Optional[dict]) -> None:
     console.print(Panel(freshness_text, title="🕐 Freshness Check", title_align="left"))
 
 
-def display_test_failures(test_failures: dict) -> None:
+def display_test_failures(test_failures: TestFailures) -> None:
     """Display test failure details in a formatted table"""
-    zarr_related = test_failures.get("zarr_related", [])
-    other_failures = test_failures.get("other_failures", [])
-    error_types = test_failures.get("error_types", [])
-    total = test_failures.get("total_failures", 0)
+    zarr_related = test_failures.zarr_related
+    other_failures = test_failures.other_failures
+    error_types = test_failures.error_types
+    total = test_failures.total_failures
 
     # Create table for test failures
     table = Table(show_header=True, header_style="bold blue")
@@ -1,26 +1,215 @@
 """GitHub API client with fallback from gh CLI to direct HTTP requests."""
 
+import gzip
+import http.client
+import io
 import json
 import os
+import shutil
 import subprocess
-import urllib.error
+import tempfile
+import threading
+import time
 import urllib.parse
-import urllib.request
+from collections.abc import Iterator
+from collections.abc import Mapping
+from functools import cached_property
+from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 from typing import Union
 
 from rich.console import Console
 
+from .cache import MISSING
+from .cache import DiskCache
 from .exceptions import GitHubAPIError
 
+try:
+    # Optional speedup (``pip install xarray-upstream-checker[fast]``); its
+    # JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 console = Console()
 
+# Throttling responses worth retrying; 403 only when it carries rate-limit
+# headers, since it is also returned for plain permission errors
+RETRY_STATUSES = (403, 429, 502)
+MAX_RETRIES = 3
+# Waits longer than this (e.g. an hour until the primary limit resets) are
+# reported as errors instead
+MAX_RETRY_WAIT = 60
+
+# Seconds a cached run listing is reused without even a conditional request;
+# new runs appear on the scale of minutes to hours
+RUNS_MAX_AGE = 60
+
+# Sent to the log storage host, which must not receive our Authorization
+# header; read-only so every request can share them without copying
+_STORAGE_HEADERS = MappingProxyType(
+    {"Accept-Encoding": "gzip", "User-Agent": "xarray-upstream-checker/0.1.0"}
+)
+_DEFAULT_HEADERS = MappingProxyType(
+    {"Accept": "application/vnd.github.v3+json", **_STORAGE_HEADERS}
+)
+
+# In-flight API requests allowed at once, unless overridden by
+# XARRAY_UPSTREAM_CONCURRENCY
+DEFAULT_CONCURRENCY = 6
+
+GH_AUTH_HINT = "gh CLI not authenticated. Please run: gh auth login"
+
+# How long a successful gh availability probe is trusted across runs
+GH_DETECT_TTL = 24 * 60 * 60
+
+CHECK_SUITE_JOBS_QUERY = """
+query($ids: [ID!]!) {
+  nodes(ids: $ids) {
+    ... on CheckSuite {
+      id
+      checkRuns(first: 100) {
+        nodes {
+          databaseId
+          name
+          status
+          conclusion
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _run_gh(
+    *args: str, check: bool = True, text: bool = True
+) -> subprocess.CompletedProcess:
+    """Run a gh CLI command, capturing its output as text (or bytes).
+
+    This blocks the calling thread only; the checker issues independent
+    lookups from a thread pool, so concurrent gh invocations still overlap.
+    """
+    return subprocess.run(["gh", *args], capture_output=True, text=text, check=check)
+
+
+def _iter_gh_lines(*args: str) -> Iterator[str]:
+    """Run a gh CLI command and yield its output lines as they arrive.
+
+    Unlike ``_run_gh`` the output is never held in memory as a whole.
+    Raises CalledProcessError once the output is exhausted if gh failed.
+    """
+    # stderr goes to a file rather than a pipe: a pipe nobody reads while
+    # stdout is streamed would block gh once it filled up
+    with tempfile.TemporaryFile() as stderr_file:
+        process = subprocess.Popen(
+            ["gh", *args],
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            encoding="utf-8",
+            errors="replace",
+        )
+        try:
+            yield from process.stdout
+            if process.wait() != 0:
+                stderr_file.seek(0)
+                raise subprocess.CalledProcessError(
+                    process.returncode,
+                    process.args,
+                    stderr=stderr_file.read().decode(errors="replace"),
+                )
+        finally:
+            if process.poll() is None:
+                # Abandoned before the end
+                process.kill()
+            process.wait()
+            process.stdout.close()
+
+
+def _retry_delay(
+    status: int, headers: http.client.HTTPMessage, attempt: int
+) -> Optional[float]:
+    """Seconds to wait before retrying a throttled response, or None to give up."""
+    if status not in RETRY_STATUSES or attempt >= MAX_RETRIES:
+        return None
+
+    retry_after = headers.get("Retry-After")
+    exhausted = headers.get("X-RateLimit-Remaining") == "0"
+    if status == 403 and retry_after is None and not exhausted:
+        return None
+
+    if retry_after and retry_after.isdigit():
+        delay = float(retry_after)
+    elif exhausted and headers.get("X-RateLimit-Reset", "").isdigit():
+        delay = int(headers["X-RateLimit-Reset"]) - time.time()
+    else:
+        delay = 2.0**attempt
+
+    if delay > MAX_RETRY_WAIT:
+        return None
+    return max(delay, 0.0)
+
+
+def _max_concurrency() -> int:
+    """In-flight request limit from ``XARRAY_UPSTREAM_CONCURRENCY``.
+
+    Invalid values fall back to the default; the limit is at least 1, since
+    a zero-sized semaphore would block every request forever.
+    """
+    try:
+        limit = int(os.getenv("XARRAY_UPSTREAM_CONCURRENCY", DEFAULT_CONCURRENCY))
+    except ValueError:
+        limit = DEFAULT_CONCURRENCY
+    return max(1, limit)
+
+
+def _gh_config_dir() -> Path:
+    """Directory holding gh's configuration, resolved the way gh does."""
+    if os.getenv("GH_CONFIG_DIR"):
+        return Path(os.environ["GH_CONFIG_DIR"])
+    if os.getenv("XDG_CONFIG_HOME"):
+        return Path(os.environ["XDG_CONFIG_HOME"]) / "gh"
+    return Path.home() / ".config" / "gh"
+
+
+def _gh_cli_error(error: subprocess.CalledProcessError) -> GitHubAPIError:
+    """Translate a failed gh invocation into a GitHubAPIError."""
+    stderr = error.stderr
+    if isinstance(stderr, bytes):
+        stderr = stderr.decode(errors="replace")
+    folded = stderr.casefold()
+    if "authentication" in folded or "not logged in" in folded:
+        return GitHubAPIError(GH_AUTH_HINT)
+    return GitHubAPIError(f"gh CLI error: {stderr}")
+
+
+def _commit_to_dict(commit: dict) -> dict:
+    """Reduce a REST commit object to the fields the checker uses."""
+    return {"sha": commit["sha"], "date": commit["commit"]["author"]["date"]}
+
 
 class GitHubAPIClient:
     """GitHub API client that falls back from gh CLI to direct HTTP requests."""
 
-    def __init__(self, force_api: Optional[str] = None):
+    # gh probes fork a process each; their results are shared by all clients
+    _gh_cli_available: Optional[bool] = None
+    _gh_auth_token = MISSING
+
+    def __init__(
+        self, force_api: Optional[str] = None, cache: Optional[DiskCache] = None
+    ):
         self.base_url = "https://api.github.com"
+        self.token: Optional[str] = None
+        # Stores ETags and bodies so unchanged resources come back as a
+        # 304, which does not count against the rate limit
+        self.cache = cache
+        # Keep-alive connections per thread, keyed by host, so concurrent
+        # callers never interleave requests on the same socket
+        self._local = threading.local()
+        # Bounds in-flight API requests across threads to stay clear of
+        # GitHub's secondary rate limits
+        self._semaphore = threading.BoundedSemaphore(_max_concurrency())
 
         # Check environment variable or use parameter
         if force_api and force_api != "auto":
@@ -28,7 +217,15 @@ class GitHubAPIClient:
         else:
             api_preference = os.getenv("XARRAY_UPSTREAM_API", force_api or "auto")
 
-        if api_preference == "rest":
+        env_token = os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN")
+        if env_token:
+            # A token in the environment (e.g. in CI) makes gh unnecessary
+            self.token = env_token
+            self.use_gh_cli = False
+            console.print(
+                "[dim]Using token from the environment for GitHub API requests[/dim]"
+            )
+        elif api_preference == "rest":
             self.use_gh_cli = False
             console.print("[blue]Using direct GitHub REST API (as requested)[/blue]")
         elif api_preference == "gh":
@@ -47,18 +244,55 @@ class GitHubAPIClient:
                     "[yellow]gh CLI not available, using direct GitHub API (rate limited)[/yellow]"
                 )
 
+        if self.use_gh_cli:
+            # Reuse gh's credentials over a persistent HTTPS connection instead
+            # of forking a gh process for every request
+            self.token = self._get_gh_auth_token()
+            if self.token:
+                self.use_gh_cli = False
+                console.print(
+                    "[dim]Using gh CLI credentials for direct GitHub API requests[/dim]"
+                )
+            elif not self._recheck_gh_cli():
+                # The positive detection may have come from the disk cache
+                # and be stale (e.g. after ``gh auth logout``)
+                self.use_gh_cli = False
+
     def _detect_gh_cli_availability(self) -> bool:
-        """Check if gh CLI is available and authenticated."""
+        """Check if gh CLI is available and authenticated (once per process).
+
+        A positive result is also cached on disk for a day, so later runs
+        skip the probe entirely; a negative one is rechecked so that a fresh
+        ``gh auth login`` is noticed straight away.
+        """
+        if GitHubAPIClient._gh_cli_available is None:
+            key = ("gh_detect",)
+            if not shutil.which("gh"):
+                available = False
+            elif self.cache and self.cache.get(key, ttl=GH_DETECT_TTL) is True:
+                available = True
+            else:
+                available = self._probe_gh_cli()
+                if available and self.cache:
+                    self.cache.set(key, True)
+            GitHubAPIClient._gh_cli_available = available
+        return GitHubAPIClient._gh_cli_available
+
+    def _recheck_gh_cli(self) -> bool:
+        """Probe gh again, replacing the cached detection result."""
+        available = self._probe_gh_cli()
+        if self.cache:
+            self.cache.set(("gh_detect",), available)
+        GitHubAPIClient._gh_cli_available = available
+        return available
+
+    def _probe_gh_cli(self) -> bool:
         try:
             # Check if gh command exists
-            subprocess.run(
-                ["gh", "--version"], capture_output=True, text=True, check=True
-            )
+            _run_gh("--version")
 
             # Check if authenticated
-            auth_result = subprocess.run(
-                ["gh", "auth", "status"], capture_output=True, text=True
-            )
+            auth_result = _run_gh("auth", "status", check=False)
 
             if auth_result.returncode == 0:
                 console.print("[green]Using gh CLI (authenticated)[/green]")
@@ -72,77 +306,258 @@ class GitHubAPIClient:
         except (subprocess.CalledProcessError, FileNotFoundError):
             return False
 
+    def _get_gh_auth_token(self) -> Optional[str]:
+        """Read the gh CLI auth token, or None if gh cannot provide one."""
+        if GitHubAPIClient._gh_auth_token is MISSING:
+            GitHubAPIClient._gh_auth_token = self._read_gh_auth_token()
+        return GitHubAPIClient._gh_auth_token
+
+    def _read_gh_auth_token(self) -> Optional[str]:
+        """Run ``gh auth token``, reusing the on-disk copy while gh's login is unchanged."""
+        # gh stores its token either in plaintext in hosts.yml or in the
+        # system keyring. Only plaintext tokens are cached (in a 0600 file),
+        # so a keyring token is never copied to disk; the entry is tied to
+        # hosts.yml's mtime, which changes on every login or logout.
+        mtime = None
+        if self.cache:
+            hosts_file = _gh_config_dir() / "hosts.yml"
+            try:
+                if "oauth_token" in hosts_file.read_text():
+                    mtime = hosts_file.stat().st_mtime_ns
+            except (OSError, UnicodeDecodeError):
+                pass
+        if mtime is not None:
+            cached = self.cache.get(("gh_token",))
+            if cached is not MISSING and cached.get("mtime") == mtime:
+                return cached["token"]
+
+        try:
+            result = _run_gh("auth", "token")
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return None
+        token = result.stdout.strip() or None
+        if mtime is not None and token:
+            self.cache.set(("gh_token",), {"mtime": mtime, "token": token})
+        return token
+
+    @cached_property
+    def _headers(self) -> Mapping[str, str]:
+        """Default headers for GitHub API requests, built once per client."""
+        if not self.token:
+            return _DEFAULT_HEADERS
+        return MappingProxyType(
+            {**_DEFAULT_HEADERS, "Authorization": f"Bearer {self.token}"}
+        )
+
+    def _send_request(
+        self,
+        path: str,
+        headers: Mapping[str, str],
+        method: str = "GET",
+        body: Optional[bytes] = None,
+    ) -> tuple[int, http.client.HTTPMessage, bytes]:
+        """Send a request over the persistent connection to the GitHub API.
+
+        The connection is kept alive between calls so only the first request
+        pays for the TCP and TLS handshakes. Bodies are requested gzip-encoded
+        and returned decompressed. Rate-limited responses are retried after
+        the delay GitHub asks for, up to ``MAX_RETRIES`` times.
+        """
+        host = urllib.parse.urlsplit(self.base_url).netloc
+        attempt = 0
+        while True:
+            with self._semaphore:
+                response = self._open(host, path, headers, method, body)
+                try:
+                    # Not ``body``: that is the request body, resent on retry
+                    payload = response.read()
+                    if response.headers.get("Content-Encoding") == "gzip":
+                        payload = gzip.decompress(payload)
+                    result = response.status, response.headers, payload
+                except (OSError, http.client.HTTPException):
+                    self._close_connection(host)
+                    raise
+
+            delay = _retry_delay(result[0], result[1], attempt)
+            if delay is None:
+                return result
+            time.sleep(delay)
+            attempt += 1
+
+    def _open(
+        self,
+        host: str,
+        path: str,
+        headers: Mapping[str, str],
+        method: str = "GET",
+        body: Optional[bytes] = None,
+    ) -> http.client.HTTPResponse:
+        """Start a request on this thread's keep-alive connection to ``host``.
+
+        The response must be read to the end before the connection is used
+        again; otherwise close it with ``_close_connection``.
+        """
+        try:
+            return self._open_once(host, path, headers, method, body)
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # The server dropped the idle connection; retry on a fresh one
+            return self._open_once(host, path, headers, method, body)
+
+    def _open_once(
+        self,
+        host: str,
+        path: str,
+        headers: Mapping[str, str],
+        method: str,
+        body: Optional[bytes],
+    ) -> http.client.HTTPResponse:
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+        connection = connections.get(host)
+        if connection is None:
+            connection = connections[host] = http.client.HTTPSConnection(
+                host, timeout=60
+            )
+        try:
+            connection.request(method, path, body=body, headers=headers)
+            return connection.getresponse()
+        except (OSError, http.client.HTTPException):
+            self._close_connection(host)
+            raise
+
+    def _close_connection(self, host: str) -> None:
+        connection = getattr(self._local, "connections", {}).pop(host, None)
+        if connection is not None:
+            connection.close()
+
     def _make_http_request(
-        self, endpoint: str, params: Optional[dict] = None
+        self,
+        endpoint: str,
+        params: Optional[dict] = None,
+        max_age: Optional[float] = None,
     ) -> Union[dict, list]:
-        """Make a direct HTTP request to GitHub API."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        """Make a direct HTTP request to GitHub API.
+
+        A cached response younger than ``max_age`` seconds is returned without
+        contacting GitHub; older ones are revalidated with a conditional
+        request.
+        """
+        path = f"/{endpoint.lstrip('/')}"
 
         if params:
             query_string = urllib.parse.urlencode(params)
-            url = f"{url}?{query_string}"
+            path = f"{path}?{query_string}"
 
-        headers = {
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "xarray-upstream-checker/0.1.0",
-        }
+        key = ("etag", path)
+        if self.cache and max_age is not None:
+            fresh = self.cache.get(key, ttl=max_age)
+            if fresh is not MISSING:
+                return fresh["body"]
+
+        headers = self._headers
+        cached = self.cache.get(key) if self.cache else MISSING
+        if cached is not MISSING:
+            headers = dict(headers)
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
 
         try:
-            request = urllib.request.Request(url, headers=headers)
-            with urllib.request.urlopen(request) as response:
-                if response.status == 200:
-                    return json.loads(response.read().decode())
-                else:
-                    raise GitHubAPIError(
-                        f"GitHub API returned status {response.status}"
-                    )
+            status, response_headers, body = self._send_request(path, headers)
+        except (OSError, http.client.HTTPException) as e:
+            raise GitHubAPIError(f"Network error accessing GitHub API: {e}") from e
 
-        except urllib.error.HTTPError as e:
-            if e.code == 403:
-                # Likely rate limiting
-                raise GitHubAPIError(
-                    "GitHub API rate limit exceeded. Try again later or install/authenticate gh CLI for higher limits."
-                ) from e
-            elif e.code == 404:
-                raise GitHubAPIError("Repository or resource not found") from e
-            else:
-                raise GitHubAPIError(f"GitHub API error: {e.code} {e.reason}") from e
-        except urllib.error.URLError as e:
+        if status == 304 and cached is not MISSING:
+            if max_age is not None:
+                # Restart the freshness window now that GitHub confirmed it
+                self.cache.set(key, cached)
+            return cached["body"]
+        elif status == 403:
+            # Likely rate limiting
+            raise GitHubAPIError(
+                "GitHub API rate limit exceeded. Try again later or install/authenticate gh CLI for higher limits."
+            )
+        elif status == 404:
+            raise GitHubAPIError("Repository or resource not found")
+        elif status != 200:
             raise GitHubAPIError(
-                f"Network error accessing GitHub API: {e.reason}"
-            ) from e
+                f"GitHub API error: {status} {http.client.responses.get(status, '')}"
+            )
+
+        try:
+            data = _json_loads(body)
         except json.JSONDecodeError as e:
             raise GitHubAPIError("Invalid JSON response from GitHub API") from e
 
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        if self.cache and (etag or last_modified):
+            self.cache.set(
+                key, {"etag": etag, "last_modified": last_modified, "body": data}
+            )
+        return data
+
     def _make_gh_cli_request(self, args: list[str]) -> Union[dict, list]:
         """Make a request using gh CLI."""
         try:
-            result = subprocess.run(
-                ["gh", *args], capture_output=True, text=True, check=True
-            )
-            return json.loads(result.stdout)
+            # Raw bytes go straight to the JSON parser, skipping a decode
+            result = _run_gh(*args, text=False)
+            return _json_loads(result.stdout)
         except subprocess.CalledProcessError as e:
-            if (
-                "authentication" in e.stderr.lower()
-                or "not logged in" in e.stderr.lower()
-            ):
-                raise GitHubAPIError(
-                    "gh CLI not authenticated. Please run: gh auth login"
-                ) from None
-            else:
-                raise GitHubAPIError(f"gh CLI error: {e.stderr}") from e
+            raise _gh_cli_error(e) from e
         except json.JSONDecodeError:
             raise GitHubAPIError("Invalid JSON response from gh CLI") from None
 
+    @property
+    def supports_graphql(self) -> bool:
+        """GitHub's GraphQL API is only available to authenticated HTTP clients."""
+        return not self.use_gh_cli and self.token is not None
+
+    def _make_graphql_request(self, query: str, variables: dict) -> dict:
+        """Run a GraphQL query and return its ``data`` payload."""
+        body = json.dumps({"query": query, "variables": variables}).encode()
+        headers = {**self._headers, "Content-Type": "application/json"}
+
+        try:
+            status, _, response_body = self._send_request(
+                "/graphql", headers, method="POST", body=body
+            )
+        except (OSError, http.client.HTTPException) as e:
+            raise GitHubAPIError(f"Network error accessing GitHub API: {e}") from e
+
+        if status != 200:
+            raise GitHubAPIError(
+                f"GitHub GraphQL API error: {status} {http.client.responses.get(status, '')}"
+            )
+
+        try:
+            response = _json_loads(response_body)
+        except json.JSONDecodeError as e:
+            raise GitHubAPIError("Invalid JSON response from GitHub API") from e
+
+        if response.get("errors"):
+            messages = "; ".join(
+                error.get("message", "") for error in response["errors"]
+            )
+            raise GitHubAPIError(f"GitHub GraphQL API error: {messages}")
+        return response["data"]
+
     def get_workflow_runs(
         self,
         repo: str,
         workflow: str,
         event: Optional[str] = None,
         branch: Optional[str] = None,
+        status: Optional[str] = None,
         limit: int = 20,
     ) -> list[dict]:
-        """Get workflow runs for a repository."""
+        """Get workflow runs for a repository.
+
+        ``event``, ``branch`` and ``status`` are applied server-side so only
+        runs that can satisfy the caller are transferred.
+        """
         if self.use_gh_cli:
             args = [
                 "run",
@@ -154,16 +569,18 @@ class GitHubAPIClient:
                 "--limit",
                 str(limit),
                 "--json",
-                "databaseId,number,headBranch,headSha,status,conclusion,createdAt,updatedAt,event",
+                "databaseId,number,attempt,headBranch,headSha,status,conclusion,createdAt,updatedAt,event",
             ]
             if event:
                 args.extend(["--event", event])
             if branch:
                 args.extend(["--branch", branch])
+            if status:
+                args.extend(["--status", status])
 
             return self._make_gh_cli_request(args)
         else:
-            # Direct API call
+            # Direct API call, scoped to the workflow so GitHub does the filtering
             params = {
                 "per_page": limit,
             }
@@ -171,104 +588,172 @@ class GitHubAPIClient:
                 params["event"] = event
             if branch:
                 params["branch"] = branch
+            if status:
+                params["status"] = status
 
-            response = self._make_http_request(f"repos/{repo}/actions/runs", params)
+            response = self._make_http_request(
+                f"repos/{repo}/actions/workflows/{urllib.parse.quote(workflow, safe='')}/runs",
+                params,
+                max_age=RUNS_MAX_AGE,
+            )
 
             # Transform API response to match gh CLI format
-            runs = []
-            for run in response.get("workflow_runs", []):
-                if workflow in run.get("path", ""):  # Filter by workflow file
-                    runs.append(
-                        {
-                            "databaseId": run["id"],
-                            "number": run["run_number"],
-                            "headBranch": run["head_branch"],
-                            "headSha": run["head_sha"],
-                            "status": run["status"],
-                            "conclusion": run["conclusion"],
-                            "createdAt": run["created_at"],
-                            "updatedAt": run["updated_at"],
-                            "event": run["event"],
-                        }
-                    )
-
-            return runs
+            return [
+                {
+                    "databaseId": run["id"],
+                    "number": run["run_number"],
+                    "attempt": run.get("run_attempt"),
+                    "headBranch": run["head_branch"],
+                    "headSha": run["head_sha"],
+                    "status": run["status"],
+                    "conclusion": run["conclusion"],
+                    "createdAt": run["created_at"],
+                    "updatedAt": run["updated_at"],
+                    "event": run["event"],
+                    "checkSuiteNodeId": run.get("check_suite_node_id"),
+                }
+                for run in response.get("workflow_runs", [])
+            ]
 
     def get_workflow_jobs(self, repo: str, run_id: int) -> list[dict]:
-        """Get jobs for a specific workflow run."""
+        """Get jobs for a specific workflow run.
+
+        Only the fields the checker uses are kept; full job objects include
+        every step and are far larger.
+        """
         if self.use_gh_cli:
-            args = ["run", "view", str(run_id), "--repo", repo, "--json", "jobs"]
-            result = self._make_gh_cli_request(args)
-            return result.get("jobs", [])
+            args = [
+                "run",
+                "view",
+                str(run_id),
+                "--repo",
+                repo,
+                "--json",
+                "jobs",
+                "--jq",
+                "[.jobs[] | {databaseId, name, status, conclusion}]",
+            ]
+            return self._make_gh_cli_request(args)
         else:
             response = self._make_http_request(
                 f"repos/{repo}/actions/runs/{run_id}/jobs"
             )
-            return response.get("jobs", [])
+            return [
+                {
+                    "id": job["id"],
+                    "name": job["name"],
+                    "status": job["status"],
+                    "conclusion": job["conclusion"],
+                }
+                for job in response.get("jobs", [])
+            ]
+
+    def get_check_suite_jobs(self, node_ids: list[str]) -> dict[str, list[dict]]:
+        """Get the jobs of several check suites in one request.
+
+        Each workflow run has a check suite whose check runs are the run's
+        jobs, so this replaces one jobs request per run. Returns jobs in the
+        REST shape keyed by check suite node id. Requires ``supports_graphql``.
+        """
+        data = self._make_graphql_request(CHECK_SUITE_JOBS_QUERY, {"ids": node_ids})
 
-    def get_job_logs(self, repo: str, job_id: int) -> str:
-        """Get logs for a specific job."""
+        jobs_by_suite = {}
+        for suite in data.get("nodes") or []:
+            if not suite:
+                continue
+            jobs_by_suite[suite["id"]] = [
+                {
+                    "id": check_run["databaseId"],
+                    "name": check_run["name"],
+                    "status": check_run["status"].lower(),
+                    "conclusion": (check_run.get("conclusion") or "").lower() or None,
+                }
+                for check_run in suite["checkRuns"]["nodes"]
+            ]
+        return jobs_by_suite
+
+    def iter_job_log_lines(self, repo: str, job_id: int) -> Iterator[str]:
+        """Yield the lines of a job's log as they are downloaded.
+
+        On the HTTP path the log is requested gzip-compressed and decoded
+        incrementally, and gh's output is read from a pipe, so the full log
+        is never held in memory.
+        """
         if self.use_gh_cli:
             # Use the API endpoint directly even with gh CLI
-            result = subprocess.run(
-                ["gh", "api", f"repos/{repo}/actions/jobs/{job_id}/logs"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            return result.stdout
-        else:
-            # Direct API call - this endpoint returns a redirect to log URL
             try:
-                request = urllib.request.Request(
-                    f"{self.base_url}/repos/{repo}/actions/jobs/{job_id}/logs"
+                yield from _iter_gh_lines(
+                    "api", f"repos/{repo}/actions/jobs/{job_id}/logs"
                 )
-                request.add_header("Accept", "application/vnd.github.v3+json")
-                request.add_header("User-Agent", "xarray-upstream-checker/0.1.0")
-
-                with urllib.request.urlopen(request) as response:
-                    return response.read().decode()
-
-            except urllib.error.HTTPError as e:
-                if e.code == 403:
-                    raise GitHubAPIError(
-                        "Cannot access job logs: GitHub API rate limit exceeded"
-                    ) from e
-                else:
-                    raise GitHubAPIError(
-                        f"Cannot access job logs: {e.code} {e.reason}"
-                    ) from e
+            except subprocess.CalledProcessError as e:
+                raise _gh_cli_error(e) from e
+            return
 
-    def get_latest_commit(self, repo: str, branch: str = "main") -> Optional[dict]:
-        """Get latest commit from a repository branch."""
-        if self.use_gh_cli:
-            try:
-                result = subprocess.run(
-                    [
-                        "gh",
-                        "api",
-                        f"repos/{repo}/commits",
-                        "--jq",
-                        ".[0] | {sha: .sha, date: .commit.author.date}",
-                    ],
-                    capture_output=True,
-                    text=True,
-                    check=True,
+        # Direct API call - this endpoint returns a redirect to log URL
+        try:
+            status, headers, body = self._send_request(
+                f"/repos/{repo}/actions/jobs/{job_id}/logs", self._headers
+            )
+            if status in (301, 302, 303, 307, 308):
+                # The log lives on a signed storage URL on another host,
+                # which must not receive our Authorization header. Its
+                # connection is kept alive too, for the next job's log.
+                location = urllib.parse.urlsplit(headers["Location"])
+                log_path = location.path
+                if location.query:
+                    log_path = f"{log_path}?{location.query}"
+                response = self._open(
+                    location.netloc,
+                    log_path,
+                    _STORAGE_HEADERS,
                 )
-                return json.loads(result.stdout)
-            except Exception:
-                return None
+                try:
+                    if response.status != 200:
+                        raise GitHubAPIError(
+                            f"Cannot access job logs: {response.status} {response.reason}"
+                        )
+                    stream = response
+                    if response.headers.get("Content-Encoding") == "gzip":
+                        stream = gzip.GzipFile(fileobj=response)
+                    yield from io.TextIOWrapper(
+                        stream, encoding="utf-8", errors="replace"
+                    )
+                finally:
+                    if not response.isclosed():
+                        # Abandoned before the end, so the socket can't be reused
+                        self._close_connection(location.netloc)
+                return
+        except (OSError, http.client.HTTPException) as e:
+            raise GitHubAPIError(f"Cannot access job logs: {e}") from e
+
+        if status == 403:
+            raise GitHubAPIError(
+                "Cannot access job logs: GitHub API rate limit exceeded"
+            )
+        elif status != 200:
+            raise GitHubAPIError(
+                f"Cannot access job logs: {status} {http.client.responses.get(status, '')}"
+            )
+        yield from body.decode(errors="replace").splitlines(keepends=True)
+
+    def get_check_run_annotations(self, repo: str, check_run_id: int) -> list[dict]:
+        """Get annotations for a check run (a job's id is also its check run id)."""
+        endpoint = f"repos/{repo}/check-runs/{check_run_id}/annotations"
+        if self.use_gh_cli:
+            return self._make_gh_cli_request(["api", f"{endpoint}?per_page=100"])
         else:
-            try:
-                response = self._make_http_request(
-                    f"repos/{repo}/commits", {"sha": branch, "per_page": 1}
+            return self._make_http_request(endpoint, {"per_page": 100})
+
+    def get_latest_commit(self, repo: str, branch: str = "main") -> Optional[dict]:
+        """Get latest commit from a repository branch."""
+        params = {"sha": branch, "per_page": 1}
+        try:
+            if self.use_gh_cli:
+                response = self._make_gh_cli_request(
+                    ["api", f"repos/{repo}/commits?{urllib.parse.urlencode(params)}"]
                 )
-                if response and len(response) > 0:
-                    commit = response[0]
-                    return {
-                        "sha": commit["sha"],
-                        "date": commit["commit"]["author"]["date"],
-                    }
-                return None
-            except Exception:
-                return None
+            else:
+                response = self._make_http_request(f"repos/{repo}/commits", params)
+            return _commit_to_dict(response[0]) if response else None
+        except Exception:
+            return None
@@ -15,14 +15,6 @@ Requirements:
 import argparse
 import sys
 
-from rich.console import Console
-
-from .checker import ZarrUpstreamChecker
-from .display import display_results
-from .exceptions import GitHubAPIError
-
-console = Console()
-
 
 def main():
     """Check Zarr upstream compatibility in xarray CI"""
@@ -31,8 +23,9 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
-  xarray-upstream-checker           # Check latest upstream-dev CI results
-  xarray-upstream-checker --help    # Show this help message
+  xarray-upstream-checker             # Check latest upstream-dev CI results
+  xarray-upstream-checker --no-cache  # Refetch everything from GitHub
+  xarray-upstream-checker --help      # Show this help message
 
 This tool checks the most recent xarray upstream-dev CI workflow run
 and reports on Zarr compatibility status, version information, and
@@ -55,19 +48,35 @@ Requirements:
         help="Choose GitHub API method: 'auto' (default), 'gh' (GitHub CLI), or 'rest' (direct REST API)",
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the on-disk cache of results for finished workflow runs",
+    )
+
     args = parser.parse_args()
 
-    checker = ZarrUpstreamChecker(api_choice=args.api)
+    # Imported only now so --help and --version don't pay for loading rich
+    # and the checker
+    from rich.console import Console
+
+    from .checker import ZarrUpstreamChecker
+    from .display import display_results
+    from .exceptions import GitHubAPIError
+
+    console = Console()
+
+    checker = ZarrUpstreamChecker(api_choice=args.api, use_cache=not args.no_cache)
 
     try:
-        results = checker.check_upstream_compatibility()
+        report = checker.check_upstream_compatibility()
         display_results(
-            results["run"],
-            results["detect_trigger_job"],
-            results["upstream_dev_job"],
-            results["zarr_version_from_logs"],
-            results["test_failures"],
-            results["zarr_commit"],
+            report.run,
+            report.detect_trigger_job,
+            report.upstream_dev_job,
+            report.zarr_version_from_logs,
+            report.test_failures,
+            report.zarr_commit,
         )
     except GitHubAPIError as e:
         console.print(f"[red]Error: {e}[/red]")
@@ -0,0 +1,52 @@
+"""Data containers for xarray upstream checker results."""
+
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Optional
+
+
+@dataclass
+class LogsAnalysis:
+    """Everything extracted from a single pass over a job log"""
+
+    zarr_version: Optional[str] = None
+    failed_tests: list[str] = field(default_factory=list)
+    error_types: list[str] = field(default_factory=list)
+    log_size: int = 0
+
+
+@dataclass
+class TestFailures:
+    """Failed upstream-dev tests, split by whether they look zarr-related"""
+
+    __slots__ = ("error_types", "other_failures", "total_failures", "zarr_related")
+
+    zarr_related: list[str]
+    other_failures: list[str]
+    error_types: list[str]
+    total_failures: int
+
+    @classmethod
+    def empty(cls) -> "TestFailures":
+        return cls(zarr_related=[], other_failures=[], error_types=[], total_failures=0)
+
+
+@dataclass
+class UpstreamReport:
+    """Result of ZarrUpstreamChecker.check_upstream_compatibility"""
+
+    __slots__ = (
+        "detect_trigger_job",
+        "run",
+        "test_failures",
+        "upstream_dev_job",
+        "zarr_commit",
+        "zarr_version_from_logs",
+    )
+
+    run: dict
+    detect_trigger_job: Optional[dict]
+    upstream_dev_job: Optional[dict]
+    zarr_version_from_logs: Optional[str]
+    test_failures: Optional[TestFailures]
+    zarr_commit: Optional[dict]